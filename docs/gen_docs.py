@@ -8,7 +8,6 @@ import mkdocs_gen_files
 # that's the only reason reason this works
 PROJECT_ROOT = Path(__file__).parents[1]
 README_PATH = PROJECT_ROOT / "README.md"
-SRC_ROOT = PROJECT_ROOT / "src"
 
 # specific objects to include pages for in the code reference
 INCLUDED_OBJECTS = [
@@ -17,8 +16,8 @@ INCLUDED_OBJECTS = [
     "reserve_it.models.resource_config.ResourceConfig",
     "reserve_it.models.reservation_request.ReservationRequest",
 ]
-# whole files to include pages for in the code reference
-INCLUDED_PY_FILES = [SRC_ROOT / "reserve_it" / "models" / "field_types.py"]
+# whole files to include pages for in the code reference, relative to src/
+INCLUDED_PY_FILES: tuple[str, ...] = ("reserve_it/models/field_types.py",)
 
 
 def gen_home_page(readme_path: Path):
@@ -27,7 +26,7 @@ def gen_home_page(readme_path: Path):
         f.write(readme_path.read_text())
 
 
-def gen_code_refs_and_nav(src_root: Path):
+def gen_code_refs_and_nav():
     """generates code reference page stubs for use by mkdocstrings, and updates the nav sidebar
     to include them"""
     nav = mkdocs_gen_files.Nav()
@@ -35,26 +34,26 @@ def gen_code_refs_and_nav(src_root: Path):
     for obj in INCLUDED_OBJECTS:
         name = obj.split(".")[-1]
         doc_path = f"{name}.md"
-        full_doc_path = Path("reference", doc_path)
+        full_doc_path = f"reference/{doc_path}"
         nav[name] = doc_path
 
         with mkdocs_gen_files.open(full_doc_path, "w") as fd:
             fd.write(f"::: {obj}")
 
-    for path in INCLUDED_PY_FILES:
-        module_path = path.relative_to(src_root).with_suffix("")
+    # these paths are trusted and simple, so plain string ops instead of PurePaths
+    for rel_path in INCLUDED_PY_FILES:
+        parts = rel_path.removesuffix(".py").split("/")
+        stem = parts[-1]
         # flatten nav to just show files, not full hierarchy
-        doc_path = Path(f"{path.stem}.md")
-        full_doc_path = Path("reference", doc_path)
+        doc_path = f"{stem}.md"
+        full_doc_path = f"reference/{doc_path}"
 
-        parts = tuple(module_path.parts)
-
-        if parts[-1] == "__init__":
+        if stem == "__init__":
             parts = parts[:-1]
-        elif parts[-1] == "__main__":
+        elif stem == "__main__":
             continue
 
-        nav[path.stem] = doc_path
+        nav[stem] = doc_path
 
         with mkdocs_gen_files.open(full_doc_path, "w") as fd:
             ident = ".".join(parts)
@@ -65,4 +64,4 @@ def gen_code_refs_and_nav(src_root: Path):
 
 
 gen_home_page(README_PATH)
-gen_code_refs_and_nav(SRC_ROOT)
+gen_code_refs_and_nav()
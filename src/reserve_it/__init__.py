@@ -1,23 +1,33 @@
-from fastapi.templating import Jinja2Templates
-from jinja2 import Environment, PackageLoader, select_autoescape
+import importlib
+from typing import TYPE_CHECKING
 
-TEMPLATES = Jinja2Templates(
-    env=Environment(
-        loader=PackageLoader("reserve_it", "app/templates"),
-        autoescape=select_autoescape(["html", "xml"]),
+if TYPE_CHECKING:
+    from fastapi.templating import Jinja2Templates
+
+    from reserve_it.app.build_app import build_app
+    from reserve_it.models.app_config import AppConfig
+    from reserve_it.models.field_types import (
+        CalendarInfo,
+        CustomFormField,
+        HtmlFormInputType,
+        ImageFile,
     )
-)
-
-from reserve_it.app.build_app import build_app
-from reserve_it.models.app_config import AppConfig
-from reserve_it.models.field_types import (
-    CalendarInfo,
-    CustomFormField,
-    HtmlFormInputType,
-    ImageFile,
-)
-from reserve_it.models.reservation_request import ReservationRequest
-from reserve_it.models.resource_config import ResourceConfig
+    from reserve_it.models.reservation_request import ReservationRequest
+    from reserve_it.models.resource_config import ResourceConfig
+
+# public name -> defining module. These are imported on first access (PEP 562) so that
+# `import reserve_it` doesn't drag in the whole app stack for consumers like the mkdocs
+# plugin that only need part of it.
+_LAZY_EXPORTS = {
+    "AppConfig": "reserve_it.models.app_config",
+    "ResourceConfig": "reserve_it.models.resource_config",
+    "CalendarInfo": "reserve_it.models.field_types",
+    "CustomFormField": "reserve_it.models.field_types",
+    "HtmlFormInputType": "reserve_it.models.field_types",
+    "ImageFile": "reserve_it.models.field_types",
+    "ReservationRequest": "reserve_it.models.reservation_request",
+    "build_app": "reserve_it.app.build_app",
+}
 
 __all__ = [
     "AppConfig",
@@ -29,3 +39,38 @@ __all__ = [
     "ReservationRequest",
     "build_app",
 ]
+
+
+def _build_templates() -> "Jinja2Templates":
+    """The app's response templates. Built on first access of `reserve_it.TEMPLATES`, so
+    importing the package (ie. just for the models) doesn't import fastapi."""
+    from fastapi.templating import Jinja2Templates
+    from jinja2 import Environment, PackageLoader, select_autoescape
+
+    from reserve_it.jinja_cache import BYTECODE_CACHE
+
+    return Jinja2Templates(
+        env=Environment(
+            loader=PackageLoader("reserve_it", "app/templates"),
+            autoescape=select_autoescape(["html", "xml"]),
+            bytecode_cache=BYTECODE_CACHE,
+        )
+    )
+
+
+def __getattr__(name: str):
+    if name == "TEMPLATES":
+        value = _build_templates()
+        globals()[name] = value
+        return value
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    # cache it so later lookups skip __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_EXPORTS, "TEMPLATES"})
@@ -0,0 +1,10 @@
+"""
+The installed package version, for keying caches that must be invalidated by upgrades.
+"""
+
+from importlib import metadata
+
+try:
+    PACKAGE_VERSION = metadata.version("reserve-it")
+except metadata.PackageNotFoundError:
+    PACKAGE_VERSION = ""
@@ -10,6 +10,7 @@ from pydantic import DirectoryPath, FilePath, ValidationError, validate_call
 
 from reserve_it.app.calendar_service import GoogleCalendarService
 from reserve_it.app.route_helpers import (
+    bind_get_endpoint,
     bind_post_endpoint,
     cancel_reservation,
     get_form,
@@ -22,7 +23,6 @@ from reserve_it.app.utils import (
     handle_validation_error,
     init_dbs_and_bundles,
     init_gcal,
-    load_resource_cfgs_from_yaml,
     log_request_validation_error,
     log_unexpected_exception,
 )
@@ -30,6 +30,7 @@ from reserve_it.models.app_config import AppConfig
 from reserve_it.models.field_types import YamlPath
 from reserve_it.models.reservation_request import ReservationRequest
 from reserve_it.models.resource_config import ResourceConfig
+from reserve_it.resource_loader import load_resource_cfgs_from_yaml
 
 DEFAULT_APP_CONFIG_FILE = "app-config.yaml"
 DEFAULT_RESOURCE_CONFIG_DIR = "resource-configs"
@@ -188,24 +189,23 @@ def _configure_app_state(
 def _register_resource_routes(
     app: FastAPI, resource_bundles: dict[str, ResourceBundle], app_config: AppConfig
 ) -> None:
+    # routes go straight onto the app with the prefix baked into the path. going through
+    # an APIRouter + include_router makes fastapi analyze every endpoint twice.
     multi_resource = len(resource_bundles) > 1
     for bundle in resource_bundles.values():
-        router: FastAPI | APIRouter
-        if multi_resource:
-            router = APIRouter(prefix=bundle.config.route_prefix)
-        else:
-            router = app
-        build_route(router, bundle, app_config)
-        if multi_resource:
-            app.include_router(router)
+        prefix = bundle.config.route_prefix if multi_resource else ""
+        build_route(app, bundle, app_config, prefix)
 
 
 def build_route(
-    router: FastAPI | APIRouter, bundle: ResourceBundle, app_cfg: AppConfig
+    router: FastAPI | APIRouter,
+    bundle: ResourceBundle,
+    app_cfg: AppConfig,
+    prefix: str = "",
 ):
-    get_form_bound = partial(get_form, config=bundle.config)
+    get_form_bound = bind_get_endpoint(get_form, bundle.config)
     router.add_api_route(
-        "/",
+        f"{prefix}/",
         endpoint=get_form_bound,
         name=f"get_form_{bundle.config.file_prefix}",
         methods=["GET"],
@@ -214,7 +214,7 @@ def build_route(
 
     submit_bound = bind_post_endpoint(submit_reservation, bundle, app_cfg)
     router.add_api_route(
-        "/reserve",
+        f"{prefix}/reserve",
         endpoint=submit_bound,
         name=f"submit_{bundle.config.file_prefix}",
         methods=["POST"],
@@ -223,7 +223,7 @@ def build_route(
 
     cancel_bound = bind_post_endpoint(cancel_reservation, bundle, app_cfg)
     router.add_api_route(
-        "/cancel",
+        f"{prefix}/cancel",
         endpoint=cancel_bound,
         name=f"cancel_{bundle.config.file_prefix}",
         methods=["POST"],
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from dataclasses import dataclass
 from typing import Protocol
 from zoneinfo import ZoneInfo
@@ -66,7 +65,7 @@ class GoogleCalendarService(CalendarService):
             timezone=self.client.timezone.key,
         )
         print(pformat(free_busy.calendars))
-        free_candidates = deepcopy(config._calendar_ids)
+        free_candidates = config._calendar_ids.copy()
 
         for cal_id in free_busy.calendars.keys():
             free_candidates.pop(cal_id, None)
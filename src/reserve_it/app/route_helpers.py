@@ -1,7 +1,6 @@
 import asyncio
 from collections import Counter
 from collections.abc import Coroutine
-from copy import deepcopy
 from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
 
@@ -44,6 +43,16 @@ async def get_form(request: Request, config: ResourceConfig):
     )
 
 
+def bind_get_endpoint(endpoint: Coroutine, config: ResourceConfig) -> Coroutine:
+    """same idea as bind_post_endpoint. a functools.partial would leave `config` in the
+    signature, and fastapi builds a (pointless, expensive) request body field for it"""
+
+    async def bound_endpoint(request: Request):
+        return await endpoint(request=request, config=config)
+
+    return bound_endpoint
+
+
 def bind_post_endpoint(
     endpoint: Coroutine, bundle: ResourceBundle, app_cfg: AppConfig
 ) -> Coroutine:
@@ -74,11 +83,7 @@ def validate_request(
     form_dict = dict(form)
     logger.debug(pformat(form_dict))
     return request_class.model_validate(
-        form_dict,
-        context={
-            "maximum_days_ahead": config.maximum_days_ahead,
-            "maximum_minutes": config.maximum_minutes,
-        },
+        form_dict, context=config._request_validation_context
     )
 
 
@@ -107,7 +112,7 @@ async def submit_reservation(
             "A new one can be made once the current one has passed or been cancelled.",
         )
 
-    free_candidates = deepcopy(config._calendar_ids)
+    free_candidates = config._calendar_ids.copy()
 
     async with resource_lock:
         # get existing gcal events, check for sharing
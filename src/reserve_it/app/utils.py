@@ -1,13 +1,10 @@
 import asyncio
-import re
 from dataclasses import dataclass
-from itertools import chain
 from time import time
 from typing import cast
 from urllib.parse import quote_plus, urlencode
 from zoneinfo import ZoneInfo
 
-import yaml
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from fastapi import FastAPI, Request, status
@@ -28,21 +25,7 @@ from reserve_it.app.database import ReservationDatabase, create_session_factory
 from reserve_it.app.reminders import ReminderService
 from reserve_it.models.app_config import AppConfig
 from reserve_it.models.reservation_request import ReservationRequest
-from reserve_it.models.resource_config import (
-    ResourceConfig,
-)
-
-LEADING_INT_PATTERN = re.compile(r"^\d+")
-LEADING_DASH_PATTERN = re.compile(r"^-")
-
-
-def extract_leading_int(s: str) -> tuple[int, str]:
-    match = re.match(LEADING_INT_PATTERN, s)
-    if match is None:
-        return 0, s
-    int_part = match.group(0)
-    the_rest = re.sub(LEADING_INT_PATTERN, "", s)
-    return int(int_part), the_rest
+from reserve_it.models.resource_config import ResourceConfig
 
 
 @dataclass
@@ -56,50 +39,14 @@ class ResourceBundle:
     resource_lock: asyncio.Lock | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AppDependencies:
     resource_bundles: dict[str, ResourceBundle]
     calendar_service: GoogleCalendarService
 
-    def __post_init__(self):
-        self.num_resources = len(self.resource_bundles)
-
-
-def load_resource_cfgs_from_yaml(
-    config_dir: DirectoryPath, app_config: AppConfig
-) -> dict[str, ResourceConfig]:
-    configs: dict[str, ResourceConfig] = {}
-    config_file_paths = list(chain(config_dir.glob("*.yaml"), config_dir.glob("*.yml")))
-
-    # sort by file names to allow explicit ordering with "1-name1", "2-name2", etc
-    config_file_paths.sort(key=lambda p: extract_leading_int(p.stem))
-
-    for path in config_file_paths:
-        # NOTE: these prefixes will be used for the route paths too
-        prefix = re.sub(LEADING_INT_PATTERN, "", path.stem)
-        prefix = re.sub(LEADING_DASH_PATTERN, "", prefix)
-
-        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-        data["file_prefix"] = prefix if len(config_file_paths) > 1 else "index"
-        data["route_prefix"] = f"/{prefix}" if len(config_file_paths) > 1 else ""
-        # update with global custom form fields if passed
-        data["custom_form_fields"] = data.get("custom_form_fields", []) + (
-            app_config.custom_form_fields
-        )
-
-        for field in ResourceConfig.DEFAULT_TO_APP_CONFIG_FIELDS:
-            if field not in data:
-                data[field] = getattr(app_config, field)
-        configs[prefix] = ResourceConfig._model_validate_cleanly(data, extra="ignore")
-
-    if not configs:
-        raise ValueError(
-            "you didn't create any resource config yaml files, or provided the wrong "
-            "path for resource_config_path"
-        )
-    # print(f"{pformat(configs)}")
-
-    return configs
+    @property
+    def num_resources(self) -> int:
+        return len(self.resource_bundles)
 
 
 def init_gcal(
@@ -193,9 +140,7 @@ def build_calendar_embed_url(config: ResourceConfig, timezone: ZoneInfo) -> str
     }
     # need to listify to handle duplicate queries for multiple calendars
     params = list(params.items())
-    for cal in config.calendars.values():
-        params.append(("src", cal.id))
-        params.append(("color", cal.color))
+    params.extend(config._calendar_embed_params)
     return base + urlencode(params, quote_via=quote_plus)
 
 
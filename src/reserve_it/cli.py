@@ -1,3 +1,5 @@
+import os
+import shutil
 from pathlib import Path
 
 import typer
@@ -59,23 +61,24 @@ def init(
     if not project_root:
         project_root = Path.cwd()
 
-    for file_or_dir in EXAMPLE_ROOT.rglob("*"):
-        relative = file_or_dir.relative_to(EXAMPLE_ROOT)
-
-        if file_or_dir.is_file():
-            dest = project_root / relative
+    # os.walk sorts entries into dirs/files from the directory listing itself, without
+    # a stat per entry like rglob + is_file/is_dir
+    for root, dir_names, file_names in os.walk(EXAMPLE_ROOT):
+        # files are copied as bytes, so keep bytecode from the example out explicitly
+        if "__pycache__" in dir_names:
+            dir_names.remove("__pycache__")
+        dest_dir = project_root / Path(root).relative_to(EXAMPLE_ROOT)
+        dest_dir.mkdir(parents=True, exist_ok=True)
+
+        for name in file_names:
+            src = Path(root, name)
+            dest = dest_dir / name
             if not dest.exists():
-                try:
-                    dest.write_text(file_or_dir.read_text("utf-8"), "utf-8")
-                except UnicodeDecodeError:  # not text, probably an image, don't need it
-                    pass
-            elif file_or_dir.name == ".gitignore":
+                shutil.copyfile(src, dest)
+            elif name == ".gitignore":
                 # append to an existing gitignore
-                with open(dest, "a", encoding="utf-8") as f:
-                    f.write("\n" + file_or_dir.read_text("utf-8"))
-
-        elif file_or_dir.is_dir():
-            (project_root / relative).mkdir(parents=True, exist_ok=True)
+                with open(dest, "ab") as f:
+                    f.write(b"\n" + src.read_bytes())
 
     ensure_gcal_credentials_dir(project_root)
 
@@ -0,0 +1,31 @@
+"""
+Small filesystem helpers shared by the config loaders and the mkdocs plugin caches.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write data to path through a temp file in the same directory that's then renamed
+    into place, so readers (and an interrupted write) never leave a partial file behind.
+    Creates the parent directory if needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def write_cache_file(path: Path, data: bytes) -> None:
+    """`write_atomic` for cache entries, which are only ever an optimization: if the
+    cache dir can't be written (ie. a read-only checkout), the entry just isn't cached."""
+    try:
+        write_atomic(path, data)
+    except OSError:
+        pass
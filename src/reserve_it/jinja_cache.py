@@ -0,0 +1,19 @@
+"""
+Jinja bytecode cache shared by the app's `TEMPLATES` environment and the mkdocs plugin's
+environment, so compiled templates survive across processes instead of being recompiled
+on every cold start.
+"""
+
+import os
+
+from jinja2 import FileSystemBytecodeCache
+
+JINJA_CACHE_ENV_VAR = "RESERVE_IT_JINJA_CACHE"
+"""Set this environment variable to a directory path to choose where compiled template
+bytecode is stored. Defaults to a per-user directory in the system temp dir."""
+
+_cache_dir = os.environ.get(JINJA_CACHE_ENV_VAR)
+if _cache_dir:
+    os.makedirs(_cache_dir, exist_ok=True)
+
+BYTECODE_CACHE = FileSystemBytecodeCache(_cache_dir)
@@ -0,0 +1,84 @@
+"""
+On-disk cache for generated resource page Markdown, keyed by a hash of everything that
+goes into rendering it. Lets mkdocs rebuilds skip Jinja rendering for unchanged
+resources. Each entry starts with a checksum line of its content, so a damaged entry is
+re-rendered instead of served.
+"""
+
+import hashlib
+import os
+import re
+from collections.abc import Callable
+from pathlib import Path
+
+from reserve_it.fs_utils import write_cache_file
+
+CACHE_DIR_NAME = ".reserve-it-cache"
+# names of the files reserve-it keeps in a cache dir, and of write_atomic's temp files
+# for them: rendered pages here, plus the resource config loader's validated configs and
+# the yaml loader's parsed json. The cache dir may be shared (ie. mkdocs-material's
+# .cache), so clear_cache only touches these.
+_ENTRY_NAME = re.compile(r"\.?[0-9a-f]{16}\.(md|resource\.json|yaml\.json)(\..+\.tmp)?")
+
+# the last page rendered or read in this process for each slot (resource), as
+# (digest, content). mkdocs serve rebuilds in the same process, so unchanged pages skip
+# even the disk read, and a changed page replaces its slot's entry rather than piling up.
+_MEMO: dict[str, tuple[str, str]] = {}
+
+
+def render_cached(
+    key_bytes: bytes, cache_dir: Path, produce: Callable[[], str], *, slot: str
+) -> str:
+    """Return the cached Markdown for `key_bytes` if present, otherwise call `produce`
+    and store its result.
+
+    Args:
+        key_bytes (bytes): all rendering inputs; any change yields a new cache entry.
+        cache_dir (Path): directory holding the cached `.md` files, created if needed.
+        produce (Callable[[], str]): renders the Markdown on a cache miss.
+        slot (str): which page this is (ie. the resource's file prefix). Only the latest
+            page per slot is kept in memory.
+
+    Returns:
+        str: the rendered Markdown.
+    """
+    digest = hashlib.sha256(key_bytes).hexdigest()[:16]
+    memo = _MEMO.get(slot)
+    if memo is not None and memo[0] == digest:
+        return memo[1]
+
+    cached = cache_dir / f"{digest}.md"
+    content = _read_entry(cached)
+    if content is None:
+        content = produce()
+        checksum = hashlib.sha256(content.encode()).hexdigest()
+        write_cache_file(cached, f"{checksum}\n{content}".encode())
+    _MEMO[slot] = (digest, content)
+    return content
+
+
+def _read_entry(path: Path) -> str | None:
+    """an entry's content, or None if it's missing or doesn't match its checksum line"""
+    try:
+        checksum, _, content = path.read_text(encoding="utf-8").partition("\n")
+    except (OSError, UnicodeDecodeError):
+        return None
+    if hashlib.sha256(content.encode()).hexdigest() != checksum:
+        return None
+    return content
+
+
+def clear_cache(cache_dir: Path) -> None:
+    """Delete reserve-it's entries from the cache directory, leaving anything else in it
+    alone, and forget pages held in memory."""
+    _MEMO.clear()
+    try:
+        with os.scandir(cache_dir) as entries:
+            names = [e.name for e in entries if _ENTRY_NAME.fullmatch(e.name)]
+    except OSError:  # no cache dir yet
+        return
+    for name in names:
+        try:
+            os.unlink(cache_dir / name)
+        except OSError:
+            pass
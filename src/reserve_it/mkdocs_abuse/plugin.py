@@ -1,46 +1,108 @@
 from __future__ import annotations
 
+import hashlib
 import importlib.resources
+import os
 import shutil
-import tempfile
-from datetime import date, datetime, timedelta
+from datetime import time
+from functools import lru_cache, partial
 from pathlib import Path
 
 from jinja2 import (
     ChoiceLoader,
+    DictLoader,
     Environment,
-    FileSystemLoader,
     PackageLoader,
     StrictUndefined,
-    select_autoescape,
 )
-from material.extensions.emoji import to_svg, twemoji
 from mkdocs.config import config_options
 from mkdocs.config.base import Config
 from mkdocs.exceptions import ConfigurationError
 from mkdocs.plugins import BasePlugin
 from mkdocs.structure.files import File, Files
-from mkdocs.structure.pages import Page
 from pydantic import BaseModel, DirectoryPath, ValidationError
 
-from reserve_it.app.utils import load_resource_cfgs_from_yaml
+from reserve_it._version import PACKAGE_VERSION
+from reserve_it.jinja_cache import BYTECODE_CACHE
+from reserve_it.mkdocs_abuse.cache import (
+    CACHE_DIR_NAME,
+    clear_cache,
+    render_cached,
+)
 from reserve_it.models.app_config import AppConfig
-from reserve_it.models.field_types import AM_PM_TIME_FORMAT, YamlPath
+from reserve_it.models.field_types import YamlPath
 from reserve_it.models.resource_config import ResourceConfig
+from reserve_it.resource_loader import load_resource_cfgs_from_yaml
 
 # mkdocs assets directories:
 EVIL_ROOT = Path(importlib.resources.files("reserve_it.mkdocs_abuse"))
 ASSETS_SRC = EVIL_ROOT / "assets"
-CSS_ASSETS = [css.name for css in ASSETS_SRC.glob("*.css")]
-JS_ASSETS = [js.name for js in ASSETS_SRC.glob("*.js")]
+# one directory scan for both asset types, in the same order glob would list them
+with os.scandir(ASSETS_SRC) as _entries:
+    _ASSET_NAMES = [entry.name for entry in _entries if entry.is_file()]
+CSS_ASSETS = tuple(name for name in _ASSET_NAMES if name.endswith(".css"))
+JS_ASSETS = tuple(name for name in _ASSET_NAMES if name.endswith(".js"))
+LOCAL_ASSETS = JS_ASSETS + CSS_ASSETS
 
 # copy JS/CSS from package into site/ and auto-include them.
 ASSETS_DEST = Path("assets/reserve-it")
 IMAGES_DEST = ASSETS_DEST / "images"
+# their urls for extra_javascript/extra_css, built once and always "/"-separated
+JS_ASSET_URLS = tuple(f"{ASSETS_DEST.as_posix()}/{js}" for js in JS_ASSETS)
+CSS_ASSET_URLS = tuple(f"{ASSETS_DEST.as_posix()}/{css}" for css in CSS_ASSETS)
 
-REMOTE_JS = ["https://unpkg.com/htmx.org@1.9.12"]
+REMOTE_JS = ("https://unpkg.com/htmx.org@1.9.12",)
 FORM_TEMPLATE = "form_page.md.j2"
 FORM_TEMPLATES_DIR = "form-templates"
+# ResourceConfig fields read by FORM_TEMPLATE, passed in as a plain json-mode dict
+FORM_TEMPLATE_FIELDS = {
+    "name",
+    "emoji",
+    "description",
+    "minutes_before_reminder",
+    "allow_end_next_day",
+    "allow_shareable",
+    "route_prefix",
+    "contact_email",
+    "image",
+}
+
+# sources of the .j2 templates this plugin renders itself, read once at import. (the
+# .html templates are for the mkdocs theme, see on_env)
+_TEMPLATE_SOURCES = {
+    tpl.name: tpl.read_text(encoding="utf-8")
+    for tpl in (EVIL_ROOT / "templates").glob("*.j2")
+}
+
+# Jinja environment for rendering templates FROM THIS INSTALLED PACKAGE. Built once at
+# import rather than per plugin instance, since mkdocs serve makes a new one per rebuild.
+# - DictLoader serves the preloaded sources, so lookups never touch the package files
+# - StrictUndefined makes missing variables fail loudly (good for debugging, and keeps
+#   FORM_TEMPLATE_FIELDS in sync with the template)
+# - compiled bytecode is shared with the app's TEMPLATES and kept across builds
+# - output is Markdown, never HTML, so autoescaping is off outright
+# - packaged templates can't change mid-build, so skip the per-render mtime check, and
+#   there's only a handful of them, so never evict a compiled one
+_JINJA_ENV = Environment(
+    loader=DictLoader(_TEMPLATE_SOURCES),
+    undefined=StrictUndefined,
+    autoescape=False,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    auto_reload=False,
+    cache_size=-1,
+    bytecode_cache=BYTECODE_CACHE,
+)
+# the compiled form page template, rendered for every resource
+_FORM_TPL = _JINJA_ENV.get_template(FORM_TEMPLATE)
+# render code version: this module's source, which holds the render code and template
+# context, so editing it (ie. on an editable install) invalidates cached pages without a
+# package version bump
+_RENDER_CODE_DIGEST = hashlib.sha256(Path(__file__).read_bytes()).digest()
+# template source, package version and render code are part of every page cache key
+_CACHE_KEY_BASE = (
+    _TEMPLATE_SOURCES[FORM_TEMPLATE] + PACKAGE_VERSION
+).encode() + _RENDER_CODE_DIGEST
 
 
 # TODO args for switching theme tweaks
@@ -55,12 +117,20 @@ class ReserveItPluginConfig(Config):
         str, default=str(Path.cwd() / "resource-configs")
     )
     assets_enabled = config_options.Type(bool, default=True)
+    # on-disk cache of rendered resource pages and loaded resource configs. Its entries
+    # are deleted at the start of the build if clean_cache is set
+    cache_enabled = config_options.Type(bool, default=True)
+    cache_dir = config_options.Type(str, default=str(Path.cwd() / CACHE_DIR_NAME))
+    clean_cache = config_options.Type(bool, default=False)
 
 
 class ConfigValidator(BaseModel):
     app_config: YamlPath
     resource_config_dir: DirectoryPath
     assets_enabled: bool
+    cache_enabled: bool
+    cache_dir: Path
+    clean_cache: bool
 
 
 class ReserveItPlugin(BasePlugin[ReserveItPluginConfig]):
@@ -76,28 +146,17 @@ class ReserveItPlugin(BasePlugin[ReserveItPluginConfig]):
     def __init__(self):
         super().__init__()
 
-        # Map virtual src_path -> generated Markdown content.
-        # MkDocs will ask us "what is the source for this page?" later.
-        self._generated_markdown: dict[str, str] = {}
-
         # Stash resources so multiple hooks can access them.
         self.resource_configs: dict[str, ResourceConfig] = {}
         self.app_config: AppConfig | None = None
-        self._tmp: tempfile.TemporaryDirectory | None = None
-        self._plugin_template_dir: Path | None = None
-
-        # Jinja environment for rendering templates FROM THIS INSTALLED PACKAGE.
-        # - PackageLoader points at reserve_it_mkdocs/templates
-        # - StrictUndefined makes missing variables fail loudly (good for debugging)
-        self._jinja = Environment(
-            loader=PackageLoader("reserve_it", "mkdocs_abuse/templates"),
-            undefined=StrictUndefined,
-            autoescape=select_autoescape(enabled_extensions=()),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
 
     # --- HOOKS ---
+    def on_startup(self, *, command, dirty):
+        """
+        Called once per mkdocs invocation. Defining it at all makes mkdocs serve keep
+        this plugin instance across rebuilds, instead of making a new one each time.
+        """
+
     def on_config(self, config):
         """
         Called early. Great place to:
@@ -115,21 +174,21 @@ class ReserveItPlugin(BasePlugin[ReserveItPluginConfig]):
             # MkDocs wants ConfigurationError for pretty output
             raise ConfigurationError(str(e)) from e
 
-        self.app_config = AppConfig.from_yaml(self.cfg.app_config)
-        self.resource_configs = load_resource_cfgs_from_yaml(
-            self.cfg.resource_config_dir, self.app_config
-        )
+        if self.cfg.clean_cache:
+            clear_cache(self.cfg.cache_dir)
+
+        self.app_config, self.resource_configs = self._load_configs()
+        self._check_images()
 
         config["site_name"] = self.app_config.title
 
-        self._extract_templates(config)
         config["extra_javascript"] += REMOTE_JS
 
         if self.cfg.assets_enabled:
             # MkDocs will emit <script src="..."> for each entry in extra_javascript.
             # It will emit <link rel="stylesheet" href="..."> for each entry in extra_css.
-            config["extra_javascript"] += [str(ASSETS_DEST / js) for js in JS_ASSETS]
-            config["extra_css"] += [str(ASSETS_DEST / css) for css in CSS_ASSETS]
+            config["extra_javascript"] += JS_ASSET_URLS
+            config["extra_css"] += CSS_ASSET_URLS
 
         return config
 
@@ -138,10 +197,8 @@ class ReserveItPlugin(BasePlugin[ReserveItPluginConfig]):
         Add plugin templates to the Jinja loader search path.
         This makes `template: ri-form.html` resolvable.
         """
-        if not self._plugin_template_dir:
-            return env
-
-        plugin_loader = FileSystemLoader(str(self._plugin_template_dir))
+        # served straight from the installed package, no copy to a temp dir needed
+        plugin_loader = PackageLoader("reserve_it", "mkdocs_abuse/templates")
 
         # Put plugin loader AFTER user's overrides but BEFORE theme defaults.
         # Usually env.loader is already a ChoiceLoader; we just extend it.
@@ -159,46 +216,34 @@ class ReserveItPlugin(BasePlugin[ReserveItPluginConfig]):
 
         We can add additional virtual pages by appending mkdocs.structure.files.File objects.
 
-        These files do NOT have to exist on disk if we also implement on_page_read_source
-        to supply their contents as strings.
+        These files do NOT have to exist on disk: each one carries its generated Markdown
+        in memory (File.content_string), which MkDocs reads instead of a source file.
         """
         # if only one page, hide the nav bar
         single_page = (len(files) + len(self.resource_configs)) == 1
 
-        # 2) For each resource, add a new virtual Markdown page.
-
+        # For each resource, generate its Markdown content now (via Jinja template,
+        # unless an identical resource was already rendered by a previous build) and add
+        # a new virtual Markdown page.
         for cfg in self.resource_configs.values():
-            # within the virtual docs tree
+            markdown = self._render_resource_page_cached(cfg, single_page)
+            # within the virtual docs tree, already in src_uri (posix) form
             src_path = f"{cfg.file_prefix}.md"
 
-            # Generate Markdown content now (via Jinja template).
-            self._generated_markdown[src_path] = self._render_resource_page_markdown(
-                cfg, single_page
-            )
-
             # Add file to MkDocs "known files". MkDocs uses docs_dir for source root,
-            # but the file doesn't actually need to exist because we'll provide content later.
-            files.append(
-                File(
-                    path=src_path,  # doc-relative path
-                    src_dir=None,  # virtual file
-                    # output root, arg already available at yaml top level
-                    dest_dir=config["site_dir"],
-                    use_directory_urls=True,
-                )
+            # but the file doesn't actually need to exist since its content is attached.
+            file = File(
+                path=src_path,  # doc-relative path
+                src_dir=None,  # virtual file
+                # output root, arg already available at yaml top level
+                dest_dir=config["site_dir"],
+                use_directory_urls=True,
             )
+            file.content_string = markdown
+            files.append(file)
 
         return files
 
-    def on_page_read_source(self, page: Page, config) -> str | None:
-        """
-        MkDocs calls this when it wants the *source Markdown text* for a page.
-
-        For our virtual pages, return the generated Markdown string.
-        For all other pages, return None to let MkDocs read from disk normally.
-        """
-        return self._generated_markdown.get(page.file.src_path)
-
     def on_post_build(self, config) -> None:
         """
         Called after MkDocs has rendered the site into `site/`.
@@ -213,12 +258,16 @@ class ReserveItPlugin(BasePlugin[ReserveItPluginConfig]):
 
         # Built site directory (where MkDocs outputs HTML/CSS/JS).
         dest_dir = config["site_dir"] / ASSETS_DEST
-        dest_dir.mkdir(parents=True)
-        for name in JS_ASSETS + CSS_ASSETS:
-            src = ASSETS_SRC / name
-            if not src.exists():
-                raise FileNotFoundError(f"reserve-it asset missing from package: {src}")
-            shutil.copy2(src, dest_dir / name)
+        # one listing of the assets dir rather than a stat per asset
+        present = set(os.listdir(ASSETS_SRC))
+        missing = [n for n in LOCAL_ASSETS if n not in present]
+        if missing:
+            raise FileNotFoundError(
+                f"reserve-it assets missing from package {ASSETS_SRC}: {missing}"
+            )
+        shutil.copytree(
+            ASSETS_SRC, dest_dir, copy_function=_copy_if_changed, dirs_exist_ok=True
+        )
 
         # copy over images, if provided
         image_rel_paths = [
@@ -226,62 +275,71 @@ class ReserveItPlugin(BasePlugin[ReserveItPluginConfig]):
         ]
         if image_rel_paths:
             image_dest_dir = config["site_dir"] / IMAGES_DEST
-            image_dest_dir.mkdir(parents=True)
+            image_dest_dir.mkdir(parents=True, exist_ok=True)
             for ipath in image_rel_paths:
                 src = self.cfg.resource_config_dir / ipath
-                shutil.copy2(src, image_dest_dir / ipath)
+                _copy_if_changed(src, image_dest_dir / ipath)
 
         self._copy_built_html_to_form_templates(config)
 
-    def on_shutdown(self):
-        # Clean up temp directory
-        if self._tmp is not None:
-            self._tmp.cleanup()
-            self._tmp = None
-
     # --- HELPERS ---
 
-    def _extract_templates(self, config):
-        """
-        Extract packaged templates to a real filesystem directory.
-        Jinja2's FileSystemLoader needs actual files.
-        """
-        self._tmp = tempfile.TemporaryDirectory(prefix="reserve_it_templates_")
-        out_dir = Path(self._tmp.name)
-
-        # reserve_it/templates inside your installed package
-        pkg_templates = EVIL_ROOT / "templates"
+    def _load_configs(self) -> tuple[AppConfig, dict[str, ResourceConfig]]:
+        """Load the app and resource configs, on every build. Both loaders cache by
+        themselves (AppConfig by file stat, resource configs by file contents, app
+        config and environment overrides), so unchanged configs are cheap to reload."""
+        app_config = AppConfig.from_yaml(self.cfg.app_config)
+        resource_configs = load_resource_cfgs_from_yaml(
+            self.cfg.resource_config_dir,
+            app_config,
+            self.cfg.cache_dir if self.cfg.cache_enabled else None,
+        )
+        return app_config, resource_configs
 
-        # Copy templates out of the package into the temp dir
-        for res in pkg_templates.rglob("*"):
-            if res.is_dir():
+    def _check_images(self) -> None:
+        """Image paths are relative to the resource-configs dir. Only the site uses the
+        images, so they're checked here rather than when loading configs, failing before
+        the build instead of when on_post_build goes to copy a missing one."""
+        for cfg in self.resource_configs.values():
+            if cfg.image is None:
                 continue
-            rel = res.relative_to(pkg_templates)
-            dst = out_dir / rel
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            dst.write_bytes(res.read_bytes())
-
-        self._plugin_template_dir = out_dir
-        return config
+            if not (self.cfg.resource_config_dir / cfg.image.path).is_file():
+                raise ConfigurationError(
+                    f"image '{cfg.image.path}' for resource '{cfg.file_prefix}' not "
+                    f"found in {self.cfg.resource_config_dir}"
+                )
 
     def _add_markdown_exts(self, config):
+        # material's emoji extension pulls in its icon index, only import it when needed
+        from material.extensions.emoji import to_svg, twemoji
+
         # 1) Ensure pymdownx.emoji is enabled
         mdx = config.setdefault("markdown_extensions", [])
         if "pymdownx.emoji" not in mdx:
             mdx.append("pymdownx.emoji")
 
         # 2) Ensure its config exists and set the callables
-        # MkDocs commonly uses `mdx_configs`; some setups use `markdown_extensions_configs`
-        cfg_key = (
-            "mdx_configs" if "mdx_configs" in config else "markdown_extensions_configs"
-        )
-        mdx_cfgs = config.setdefault(cfg_key, {})
+        # (mdx_configs is where mkdocs keeps per-extension configs, since 1.4)
+        mdx_cfgs = config.setdefault("mdx_configs", {})
         emoji_cfg = mdx_cfgs.setdefault("pymdownx.emoji", {})
 
         # Set/override the bits you want
         emoji_cfg["emoji_index"] = twemoji
         emoji_cfg["emoji_generator"] = to_svg
 
+    def _render_resource_page_cached(
+        self, resource: ResourceConfig, single_page: bool
+    ) -> str:
+        """Resource page Markdown from the on-disk cache, rendering it on a miss."""
+        if not self.cfg.cache_enabled:
+            return self._render_resource_page_markdown(resource, single_page)
+        return render_cached(
+            _CACHE_KEY_BASE + f"{single_page}".encode() + resource._json_bytes,
+            self.cfg.cache_dir,
+            partial(self._render_resource_page_markdown, resource, single_page),
+            slot=resource.file_prefix,
+        )
+
     def _render_resource_page_markdown(
         self, resource: ResourceConfig, single_page: bool
     ) -> str:
@@ -289,29 +347,23 @@ class ReserveItPlugin(BasePlugin[ReserveItPluginConfig]):
         Custom Jinja step renders resource page Markdown using a template shipped in this package.
         Makes use of yaml frontmatter in the markdown page.
         """
-        tpl = self._jinja.get_template(FORM_TEMPLATE)
-
-        dt_start = datetime.combine(date.today(), resource.day_start_time)
-        dt_end = datetime.combine(date.today(), resource.day_end_time)
-        time_slots = [dt_start]
-
-        while (
-            next_dt := time_slots[-1] + timedelta(minutes=resource.minutes_increment)
-        ) <= dt_end:
-            time_slots.append(next_dt)
-
-        time_slots = [dt.time().strftime(AM_PM_TIME_FORMAT) for dt in time_slots]
+        time_slots = list(
+            _build_time_slots(
+                resource.day_start_time,
+                resource.day_end_time,
+                resource.minutes_increment,
+            )
+        )
 
         # Everything passed here becomes available in the .md.j2 template.
-        return tpl.render(
+        return _FORM_TPL.render(
             single_page=single_page,
-            resource=resource,
+            resource=resource.model_dump(mode="json", include=FORM_TEMPLATE_FIELDS),
             image_path=(IMAGES_DEST / resource.image.path).as_posix()
             if resource.image
             else None,
-            custom_form_fields=[
-                model.model_dump(mode="json") for model in resource.custom_form_fields
-            ],
+            image_name=resource.image.path.name if resource.image else None,
+            custom_form_fields=resource._custom_form_fields_json,
             time_slots=time_slots,
         )
 
@@ -339,3 +391,39 @@ class ReserveItPlugin(BasePlugin[ReserveItPluginConfig]):
                 return path
 
         return None
+
+
+def _copy_if_changed(src: str | Path, dst: str | Path) -> None:
+    """Copy file contents only (site assets don't need metadata, and copyfile uses
+    sendfile where available), skipping files already copied since src last changed.
+    Not hardlinked, since a later plugin editing the site file would edit the source."""
+    src_stat = os.stat(src)
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        pass
+    else:
+        if (
+            dst_stat.st_size == src_stat.st_size
+            and dst_stat.st_mtime_ns >= src_stat.st_mtime_ns
+        ):
+            return
+    shutil.copyfile(src, dst)
+
+
+@lru_cache
+def _build_time_slots(start: time, end: time, step: int) -> tuple[str, ...]:
+    """AM/PM formatted form time slots, every `step` minutes from `start` up to and
+    including `end`. Cached since resources commonly share the same day bounds."""
+    start_min = start.hour * 60 + start.minute
+    end_min = end.hour * 60 + end.minute
+    return tuple(
+        _format_ampm(*divmod(minutes, 60))
+        for minutes in range(start_min, end_min + 1, step)
+    )
+
+
+def _format_ampm(hour: int, minute: int) -> str:
+    """Same output as `time(hour, minute).strftime(AM_PM_TIME_FORMAT)`, without
+    strftime's per-call format parsing."""
+    return f"{hour % 12 or 12:02d}:{minute:02d} {'AM' if hour < 12 else 'PM'}"
@@ -1,12 +1,13 @@
+from functools import lru_cache
+from pathlib import Path
 from typing import Self
 from zoneinfo import ZoneInfo
 
-import yaml
-from loguru import logger
 from pydantic import EmailStr, Field, PositiveInt, ValidationError
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from reserve_it.models.field_types import CustomFormField, YamlPath
+from reserve_it.yaml_loader import load_yaml_file
 
 
 class AppConfig(BaseSettings):
@@ -66,15 +67,29 @@ class AppConfig(BaseSettings):
     calendar_shown: bool = True
     contact_email: EmailStr | None = None
 
+    # from_yaml hands the same cached instance to every caller (app, mkdocs plugin), so
+    # it can't be mutable, same as ResourceConfig
+    model_config = SettingsConfigDict(frozen=True)
+
     @classmethod
     def from_yaml(cls, path: YamlPath) -> Self:
         """helper method to load the config from the yaml path passed.
 
+        Loads are cached by the file's path, mtime and size, so loading an unchanged
+        file again returns the same (frozen) instance. Environment variables are only
+        read on the first load of a file, later changes to them are ignored until the
+        file itself changes.
+
         Args:
             path (YamlPath): pathlib.Path object for a valid yaml file defining the
                 config with the same args listed.
         """
-        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        stat = path.stat()
+        return _from_yaml_cached(cls, str(path), stat.st_mtime_ns, stat.st_size)
+
+    @classmethod
+    def _from_yaml_uncached(cls, path: Path) -> Self:
+        data = load_yaml_file(path)
         return cls._model_validate_cleanly(data)
 
     @classmethod
@@ -83,6 +98,16 @@ class AppConfig(BaseSettings):
         try:
             return super().model_validate(obj, context=context, **kwargs)
         except ValidationError as e:
+            from loguru import logger
+
             logger.error(f"Error loading AppConfig: {e}")
             # Kill the process cleanly; uvicorn will just see a non-zero exit
             raise SystemExit(1) from e
+
+
+@lru_cache(maxsize=32)
+def _from_yaml_cached(
+    cls: type[AppConfig], path: str, mtime_ns: int, size: int
+) -> AppConfig:
+    """mtime_ns and size are only part of the cache key, so edits invalidate it"""
+    return cls._from_yaml_uncached(Path(path))
@@ -3,6 +3,7 @@ Definitions of custom types for `ResourceConfig` fields.
 """
 
 from datetime import datetime, time
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated, Any, Literal
 
@@ -28,10 +29,34 @@ def parse_ampm_time(v: Any) -> time:
     if isinstance(v, datetime):
         return v.time()
     if isinstance(v, str):
-        return datetime.strptime(v, AM_PM_TIME_FORMAT).time()
+        return _parse_ampm_str(v)
     raise TypeError(f"Expected datetime, time or AM/PM string, got {type(v)!r}")
 
 
+@lru_cache(maxsize=256)
+def _parse_ampm_str(v: str) -> time:
+    """configs reuse a handful of times ("8:00 AM" etc), and strptime is slow. Plain
+    `H:MM AM` strings are split by hand, anything else goes to strptime, which also
+    raises the errors."""
+    hour_minute, _, am_pm = v.partition(" ")
+    hour, _, minute = hour_minute.partition(":")
+    if (
+        v.isascii()
+        and hour.isdigit()
+        and minute.isdigit()
+        and len(hour) <= 2
+        and len(minute) <= 2
+        and 1 <= int(hour) <= 12
+        and int(minute) < 60
+    ):
+        am_pm = am_pm.upper()
+        if am_pm == "AM":
+            return time(int(hour) % 12, int(minute))
+        if am_pm == "PM":
+            return time(int(hour) % 12 + 12, int(minute))
+    return datetime.strptime(v, AM_PM_TIME_FORMAT).time()
+
+
 AmPmTime = Annotated[time, BeforeValidator(parse_ampm_time)]
 """Clock time that can be parsed from a string in AM/PM 12-hour format, `HH:MM AM/PM`."""
 
@@ -83,6 +108,8 @@ class CalendarInfo(BaseModel):
     id: str
     color: HexColor | None = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class CustomFormField(BaseModel):
     """
@@ -109,7 +136,7 @@ class CustomFormField(BaseModel):
     required: bool = True
     title: str = ""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", frozen=True)
 
 
 class ImageFile(BaseModel):
@@ -131,3 +158,5 @@ class ImageFile(BaseModel):
     caption: str = ""
     pixel_width: int | None = None
     pixel_height: int | None = None
+
+    model_config = ConfigDict(frozen=True)
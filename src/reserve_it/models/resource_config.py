@@ -1,26 +1,39 @@
+import json
+import os
 from datetime import time
-from functools import cached_property
-from typing import ClassVar, Self
+from functools import cached_property, lru_cache
+from types import MappingProxyType, UnionType
+from typing import Annotated, Any, ClassVar, Self, Union, get_args, get_origin
 
-from loguru import logger
+from dotenv import dotenv_values
 from pydantic import (
+    BaseModel,
+    ConfigDict,
     EmailStr,
     Field,
+    PlainSerializer,
     PositiveInt,
     ValidationError,
     model_validator,
 )
-from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from reserve_it.models.field_types import (
+    AM_PM_TIME_FORMAT,
     AmPmTime,
     CalendarInfo,
     CustomFormField,
     ImageFile,
 )
 
+# config times dump back to their AM/PM input format in json, so a config's _json_bytes
+# validates again (see from_json_bytes)
+_ConfigAmPmTime = Annotated[
+    AmPmTime,
+    PlainSerializer(lambda t: t.strftime(AM_PM_TIME_FORMAT), when_used="json"),
+]
+
 
-class ResourceConfig(BaseSettings):
+class ResourceConfig(BaseModel):
     """Reservation resource configuration model, loaded from the yaml files you add to your
     `resource-configs` directory.
     Encapsulates as many individual calendars as you put in the calendars dict,
@@ -101,8 +114,12 @@ class ResourceConfig(BaseSettings):
     route_prefix: str
     name: str
     calendars: dict[str, CalendarInfo]
-    day_start_time: AmPmTime = Field(default_factory=lambda: time(hour=0, minute=0))
-    day_end_time: AmPmTime = Field(default_factory=lambda: time(hour=23, minute=59))
+    day_start_time: _ConfigAmPmTime = Field(
+        default_factory=lambda: time(hour=0, minute=0)
+    )
+    day_end_time: _ConfigAmPmTime = Field(
+        default_factory=lambda: time(hour=23, minute=59)
+    )
     minutes_increment: PositiveInt = 30
     maximum_minutes: PositiveInt = 120
     allow_end_next_day: bool = False
@@ -120,25 +137,66 @@ class ResourceConfig(BaseSettings):
     calendar_shown: bool
     contact_email: EmailStr | None
 
-    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+    # validated configs are cached and shared between builds, and app config custom form
+    # fields are shared between resources, so none of them are mutable.
+    model_config = ConfigDict(extra="ignore", frozen=True)
 
     @model_validator(mode="after")
-    def end_after_start(self) -> Self:
+    def check_time_settings(self) -> Self:
+        """both cross-field checks in one validator, saving a python callback per model"""
         if self.day_start_time >= self.day_end_time:
             raise ValueError("day_start_time must be before day_end_time.")
-        return self
-
-    @model_validator(mode="after")
-    def maximum_minutes_is_multiple(self) -> Self:
         if self.maximum_minutes % self.minutes_increment != 0:
             raise ValueError("maximum_minutes must be a multiple of minutes_increment.")
         return self
 
     @cached_property
     def _calendar_ids(self) -> dict[str, str]:
-        """dict[cal_id, event_label], this ends up being useful."""
+        """dict[cal_id, event_label], this ends up being useful. Values are plain strs, so
+        a shallow .copy() is enough for a mutable per-request copy."""
         return {cal.id: label for label, cal in self.calendars.items()}
 
+    @cached_property
+    def _calendar_embed_params(self) -> tuple[tuple[str, str | None], ...]:
+        """("src", id), ("color", color) query params per calendar for the calendar embed
+        url, which is rebuilt on every form page request."""
+        return tuple(
+            param
+            for cal in self.calendars.values()
+            for param in (("src", cal.id), ("color", cal.color))
+        )
+
+    @cached_property
+    def _custom_form_fields_json(self) -> list[dict]:
+        """custom_form_fields dumped to json-compatible dicts, for the form page template.
+        Computed once per config."""
+        return [field.model_dump(mode="json") for field in self.custom_form_fields]
+
+    @cached_property
+    def _request_validation_context(self) -> MappingProxyType:
+        """Per-resource limits passed as the validation context of every incoming
+        ReservationRequest. Built once, read-only since it's shared between requests."""
+        return MappingProxyType(
+            {
+                "maximum_days_ahead": self.maximum_days_ahead,
+                "maximum_minutes": self.maximum_minutes,
+            }
+        )
+
+    @cached_property
+    def _json_bytes(self) -> bytes:
+        """The whole config serialized to json, once. Safe to cache since the model is
+        frozen; used to key the mkdocs plugin's page cache, and stored by the resource
+        config loader's on-disk cache."""
+        return self.__pydantic_serializer__.to_json(self)
+
+    @classmethod
+    def from_json_bytes(cls, data: bytes) -> Self:
+        """Validate a config straight from json bytes, ie. a stored `_json_bytes`, without
+        going through a python dict first. The data is taken as complete, so environment
+        overrides aren't applied."""
+        return cls.__pydantic_validator__.validate_json(data)
+
     @cached_property
     def calendar_shown_final(self) -> bool:
         return len(self.calendars) <= self.MAX_CALENDARS_SHOWN and self.calendar_shown
@@ -146,13 +204,64 @@ class ResourceConfig(BaseSettings):
     @classmethod
     def _model_validate_cleanly(cls, obj: dict, *, context=None, **kwargs):
         """model_validate overload that adds helpful error log for determining which
-        resource config is bad in the case of many resources
+        resource config is bad in the case of many resources. Values from environment
+        variables / `.env` fill in fields missing from obj.
         """
+        obj = {**env_overrides(), **obj}
         try:
             return super().model_validate(obj, context=context, **kwargs)
         except ValidationError as e:
+            from loguru import logger
+
             logger.error(
                 f"Error loading ResourceConfig for resource '{obj['route_prefix']}': {e}"
             )
             # Kill the process cleanly; uvicorn will just see a non-zero exit
             raise SystemExit(1) from e
+
+
+def env_overrides() -> dict[str, Any]:
+    """ResourceConfig field values set through environment variables or the `.env` file
+    (environment wins), matched case-insensitively. Dict/list/model fields are given as
+    json. The result is cached until `.env` (by mtime and size) or one of the matching
+    environment variables changes, so ie. mkdocs serve picks up edits. Don't mutate it."""
+    try:
+        stat = os.stat(".env")
+        dotenv_state = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        dotenv_state = None
+    environ = tuple(
+        (key, value)
+        for key, value in os.environ.items()
+        if key.lower() in ResourceConfig.model_fields
+    )
+    return _env_overrides(dotenv_state, environ)
+
+
+@lru_cache(maxsize=1)
+def _env_overrides(
+    dotenv_state: tuple[int, int] | None, environ: tuple[tuple[str, str], ...]
+) -> dict[str, Any]:
+    """dotenv_state is only part of the cache key, so `.env` edits invalidate it"""
+    overrides: dict[str, Any] = {}
+    dotenv = dotenv_values(".env") if dotenv_state is not None else {}
+    for source in (dotenv, dict(environ)):
+        for key, value in source.items():
+            name = key.lower()
+            if value is None or name not in ResourceConfig.model_fields:
+                continue
+            if _is_complex(ResourceConfig.model_fields[name].annotation):
+                try:
+                    value = json.loads(value)
+                except ValueError:
+                    pass  # let validation report it
+            overrides[name] = value
+    return overrides
+
+
+def _is_complex(annotation: Any) -> bool:
+    if get_origin(annotation) in (Union, UnionType):
+        return any(_is_complex(arg) for arg in get_args(annotation))
+    return get_origin(annotation) in (dict, list) or (
+        isinstance(annotation, type) and issubclass(annotation, BaseModel)
+    )
@@ -0,0 +1,143 @@
+"""
+Loading resource configs from their yaml files. Kept apart from the app utilities so the
+mkdocs plugin can load configs without importing the fastapi/database stack. For the same
+reason, this module and the config models only import loguru where they log an error.
+"""
+
+import hashlib
+import os
+import re
+from pathlib import Path
+
+from pydantic import DirectoryPath, ValidationError
+
+from reserve_it._version import PACKAGE_VERSION
+from reserve_it.fs_utils import write_cache_file
+from reserve_it.models.app_config import AppConfig
+from reserve_it.models.resource_config import ResourceConfig, env_overrides
+from reserve_it.yaml_loader import load_yaml_bytes
+
+# validated resource configs, keyed by yaml file contents + the app config they were merged
+# with, so an unchanged file isn't revalidated when a sibling changes (ie. mkdocs serve).
+# hashing the bytes instead of using mtimes means touched/checked out files still hit.
+_RESOURCE_CFG_CACHE: dict[tuple, ResourceConfig] = {}
+
+LEADING_INT_PATTERN = re.compile(r"^\d+")
+# ordering prefix of a resource config file name, ie. the "1-" in "1-courts.yaml"
+ORDERING_PREFIX_PATTERN = re.compile(r"^\d*-?")
+
+
+def extract_leading_int(s: str) -> tuple[int, str]:
+    match = LEADING_INT_PATTERN.match(s)
+    if match is None:
+        return 0, s
+    return int(match.group(0)), s[match.end() :]
+
+
+def find_resource_cfg_paths(config_dir: DirectoryPath) -> list[Path]:
+    """All yaml files directly in config_dir, in one directory scan whose entries already
+    know their file type (no extra stat per entry)."""
+    with os.scandir(config_dir) as entries:
+        paths = [
+            Path(entry.path)
+            for entry in entries
+            if entry.name.endswith((".yaml", ".yml")) and entry.is_file()
+        ]
+    # sort by file names to allow explicit ordering with "1-name1", "2-name2", etc
+    paths.sort(key=lambda p: extract_leading_int(p.stem))
+    return paths
+
+
+def load_resource_cfgs_from_yaml(
+    config_dir: DirectoryPath,
+    app_config: AppConfig,
+    cache_dir: Path | None = None,
+) -> dict[str, ResourceConfig]:
+    """Load and validate every resource config yaml file in config_dir, merged with the
+    global app config values.
+
+    Args:
+        config_dir (DirectoryPath): the resource-configs directory.
+        app_config (AppConfig): the loaded app config.
+        cache_dir (Path | None, optional): if passed, parsed yaml (as json) and validated
+            configs (as json) are stored here, so later processes loading identical
+            files skip parsing, and validate straight from json. Defaults to None.
+
+    Returns:
+        dict[str, ResourceConfig]: configs by resource prefix, in file order.
+    """
+    configs: dict[str, ResourceConfig] = {}
+    config_file_paths = find_resource_cfg_paths(config_dir)
+    multi_resource = len(config_file_paths) > 1
+    app_config_json = app_config.model_dump_json()
+    env_state = repr(sorted(env_overrides().items()))
+    cache: dict[tuple, ResourceConfig] = {}
+
+    for path in config_file_paths:
+        # NOTE: these prefixes will be used for the route paths too
+        prefix = ORDERING_PREFIX_PATTERN.sub("", path.stem, count=1)
+
+        # read once, the same bytes are hashed for the cache key and parsed on a miss
+        raw = path.read_bytes()
+        key = (
+            str(path),
+            hashlib.blake2b(raw, digest_size=16).digest(),
+            multi_resource,
+            app_config_json,
+            env_state,
+        )
+        cached = _RESOURCE_CFG_CACHE.get(key)
+        if cached is None and cache_dir is not None:
+            json_path = cache_dir / f"{_cache_digest(key)}.resource.json"
+            cached = _load_cached_cfg(json_path)
+        if cached is not None:
+            configs[prefix] = cache[key] = cached
+            continue
+
+        data = load_yaml_bytes(raw, cache_dir)
+        data["file_prefix"] = prefix if multi_resource else "index"
+        data["route_prefix"] = f"/{prefix}" if multi_resource else ""
+        # update with global custom form fields if passed
+        data["custom_form_fields"] = data.get("custom_form_fields", []) + (
+            app_config.custom_form_fields
+        )
+
+        for field in ResourceConfig.DEFAULT_TO_APP_CONFIG_FIELDS:
+            if field not in data:
+                data[field] = getattr(app_config, field)
+        cfg = ResourceConfig._model_validate_cleanly(data, extra="ignore")
+        configs[prefix] = cache[key] = cfg
+        if cache_dir is not None:
+            write_cache_file(json_path, cfg._json_bytes)
+
+    if not configs:
+        raise ValueError(
+            "you didn't create any resource config yaml files, or provided the wrong "
+            "path for resource_config_path"
+        )
+    # print(f"{pformat(configs)}")
+
+    # only keep the current files' entries, stale ones would never be hit again
+    _RESOURCE_CFG_CACHE.clear()
+    _RESOURCE_CFG_CACHE.update(cache)
+
+    return configs
+
+
+def _cache_digest(key: tuple) -> str:
+    """cache file name for a validated config, also invalidated by package upgrades"""
+    versioned = repr((key, PACKAGE_VERSION)).encode()
+    return hashlib.sha256(versioned).hexdigest()[:16]
+
+
+def _load_cached_cfg(path: Path) -> ResourceConfig | None:
+    try:
+        return ResourceConfig.from_json_bytes(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    # unreadable, truncated, or not a valid config anymore: just revalidate the yaml
+    except (OSError, ValidationError):
+        from loguru import logger
+
+        logger.debug(f"ignoring unreadable resource config cache file {path}")
+        return None
@@ -0,0 +1,65 @@
+"""
+Yaml parsing shared by the app and resource config loaders. Uses the libyaml C bindings when
+pyyaml was built with them, which parse config-sized files several times faster than the
+pure python loader.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import yaml
+
+from reserve_it.fs_utils import write_cache_file
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pyyaml built without libyaml
+    from yaml import SafeLoader
+
+
+def load_yaml_file(path: Path, json_cache_dir: Path | None = None) -> dict:
+    """Safe-load a yaml file into a dict (empty if the file is empty). The raw bytes go
+    straight to the parser, which handles decoding itself.
+
+    Args:
+        path (Path): the yaml file.
+        json_cache_dir (Path | None, optional): if passed, the parsed data is also stored
+            here as json, named by a hash of the yaml bytes, and later loads of identical
+            yaml read that instead of parsing. Defaults to None.
+
+    Returns:
+        dict: the parsed yaml.
+    """
+    return load_yaml_bytes(path.read_bytes(), json_cache_dir)
+
+
+def load_yaml_bytes(raw: bytes, json_cache_dir: Path | None = None) -> dict:
+    """`load_yaml_file` for yaml that's already been read, ie. by a caller that also
+    hashes the file contents, so each file is only read once."""
+    if json_cache_dir is None:
+        return _parse(raw)
+
+    digest = hashlib.sha256(raw).hexdigest()[:16]
+    cached = json_cache_dir / f"{digest}.yaml.json"
+    try:
+        data = json.loads(cached.read_bytes())
+    except (OSError, ValueError):  # missing, or damaged: parse the yaml and rewrite it
+        pass
+    else:
+        if isinstance(data, dict):
+            return data
+
+    data = _parse(raw)
+    try:
+        encoded = json.dumps(data)
+    except TypeError:  # yaml values without a json equivalent, ie. dates
+        return data
+    # only cache if json round-trips it exactly (ie. no non-string keys)
+    if json.loads(encoded) == data:
+        write_cache_file(cached, encoded.encode())
+    return data
+
+
+def _parse(raw: bytes) -> dict:
+    return yaml.load(raw, Loader=SafeLoader) or {}
@@ -3,6 +3,18 @@ from __future__ import annotations
 import sys
 from importlib import metadata
 from importlib.resources import files
+from importlib.resources.abc import Traversable
+
+
+def _package_files(node: Traversable, prefix: str = ""):
+    """posix paths of every file under node, relative to it, from one walk of the tree
+    (a zipped install is scanned once, not once per looked-up path)"""
+    for child in node.iterdir():
+        rel = f"{prefix}{child.name}"
+        if child.is_dir():
+            yield from _package_files(child, f"{rel}/")
+        else:
+            yield rel
 
 
 def main() -> None:
@@ -27,8 +39,9 @@ def main() -> None:
         "example/docs/readme.md",
         "example/.gitignore",
     ]
-    for f in nonpy_files_to_check:
-        assert (files("reserve_it") / f).is_file(), f"Missing file in package data: {f}"
+    present = set(_package_files(files("reserve_it")))
+    missing = [f for f in nonpy_files_to_check if f not in present]
+    assert not missing, f"Missing files in package data: {missing}"
 
     # 3) FastAPI templating can load it (catches wrong loader/search path)
     from fastapi.templating import Jinja2Templates
@@ -1,21 +1,31 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
+from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 from zoneinfo import ZoneInfo
 
 import pytest
 from apscheduler.jobstores.base import JobLookupError
+from pydantic import ValidationError
 
+import reserve_it
+from reserve_it import resource_loader
 from reserve_it.app.build_app import _normalize_request_classes
 from reserve_it.app.calendar_service import GoogleCalendarService
 from reserve_it.app.database import ReservationDatabase
 from reserve_it.app.reminders import ReminderService
+from reserve_it.models.app_config import AppConfig
+from reserve_it.models.field_types import AM_PM_TIME_FORMAT, parse_ampm_time
 from reserve_it.models.reservation import Reservation
 from reserve_it.models.reservation_request import ReservationRequest
-from reserve_it.models.resource_config import ResourceConfig
+from reserve_it.models.resource_config import ResourceConfig, env_overrides
+from reserve_it.resource_loader import load_resource_cfgs_from_yaml
+from reserve_it.yaml_loader import load_yaml_file
+
+EXAMPLE_ROOT = Path(reserve_it.__file__).parent / "example"
 
 
 @pytest.fixture
@@ -113,3 +123,171 @@ def test_reminder_service_schedule_and_cancel():
     scheduler.remove_job.side_effect = JobLookupError("missing")
     service.cancel("reminder-1")
     scheduler.remove_job.assert_called_once_with("reminder-1")
+
+
+def test_load_resource_cfgs_strips_ordering_prefix():
+    app_config = AppConfig.from_yaml(EXAMPLE_ROOT / "app-config.yaml")
+    configs = load_resource_cfgs_from_yaml(
+        EXAMPLE_ROOT / "resource-configs", app_config
+    )
+
+    assert list(configs) == ["chargers", "courts"]
+    chargers = configs["chargers"]
+    assert chargers.file_prefix == "chargers"
+    assert chargers.route_prefix == "/chargers"
+    # global custom form fields are appended to the resource's own
+    assert [f.name for f in chargers.custom_form_fields] == [
+        "make",
+        "model",
+        "password",
+    ]
+
+
+def test_app_config_from_yaml_cached_until_file_changes(tmp_path):
+    path = tmp_path / "app-config.yaml"
+    path.write_text((EXAMPLE_ROOT / "app-config.yaml").read_text())
+
+    first = AppConfig.from_yaml(path)
+    assert AppConfig.from_yaml(path) is first
+    # shared between callers, so it can't be changed by one of them
+    with pytest.raises(ValidationError):
+        first.db_echo = True
+
+    path.write_text(path.read_text() + "\ndb_echo: true\n")
+    reloaded = AppConfig.from_yaml(path)
+    assert reloaded is not first
+    assert reloaded.db_echo
+
+
+def test_load_resource_cfgs_only_revalidates_changed_files(tmp_path):
+    config_dir = tmp_path / "resource-configs"
+    config_dir.mkdir()
+    for src in (EXAMPLE_ROOT / "resource-configs").iterdir():
+        (config_dir / src.name).write_bytes(src.read_bytes())
+    app_config = AppConfig.from_yaml(EXAMPLE_ROOT / "app-config.yaml")
+
+    first = load_resource_cfgs_from_yaml(config_dir, app_config)
+    chargers_path = next(config_dir.glob("*chargers.yaml"))
+    chargers_path.write_text(chargers_path.read_text())  # new mtime, same contents
+    courts_path = next(config_dir.glob("*courts.yaml"))
+    courts_path.write_text(courts_path.read_text() + "\nemoji: X\n")
+    second = load_resource_cfgs_from_yaml(config_dir, app_config)
+
+    assert second["chargers"] is first["chargers"]
+    assert second["courts"] is not first["courts"]
+    assert second["courts"].emoji == "X"
+
+
+def test_load_yaml_file_json_cache(tmp_path):
+    cache_dir = tmp_path / "cache"
+    yaml_path = tmp_path / "config.yaml"
+    yaml_path.write_text("name: Courts\nmaximum_days_ahead: 14\n")
+
+    data = load_yaml_file(yaml_path, cache_dir)
+    (cached,) = cache_dir.glob("*.yaml.json")
+    assert (
+        load_yaml_file(yaml_path, cache_dir)
+        == data
+        == {
+            "name": "Courts",
+            "maximum_days_ahead": 14,
+        }
+    )
+
+    # a damaged json copy isn't fatal, the yaml is parsed again and the copy rewritten
+    good = cached.read_bytes()
+    cached.write_bytes(good[:-4])
+    assert load_yaml_file(yaml_path, cache_dir) == data
+    assert cached.read_bytes() == good
+
+    # dates have no json equivalent, so that file is parsed every time instead
+    yaml_path.write_text("day: 2024-01-01\n")
+    load_yaml_file(yaml_path, cache_dir)
+    assert list(cache_dir.glob("*.yaml.json")) == [cached]
+
+
+def test_parse_ampm_time_matches_strptime():
+    for hour in range(24):
+        for minute in range(60):
+            text = time(hour, minute).strftime(AM_PM_TIME_FORMAT)
+            for variant in (text, text.lower(), text.lstrip("0")):
+                assert parse_ampm_time(variant) == time(hour, minute)
+
+    for bad in ("0:30 AM", "13:00 PM", "12:60 PM", "8:30", "8:30 XM", "830 AM"):
+        with pytest.raises(ValueError):
+            parse_ampm_time(bad)
+
+
+def test_load_resource_cfgs_reuses_cached_configs(tmp_path, monkeypatch):
+    app_config = AppConfig.from_yaml(EXAMPLE_ROOT / "app-config.yaml")
+    config_dir = EXAMPLE_ROOT / "resource-configs"
+    first = load_resource_cfgs_from_yaml(config_dir, app_config, tmp_path)
+
+    # a fresh process has an empty in-memory cache, and shouldn't need to validate
+    monkeypatch.setattr(resource_loader, "_RESOURCE_CFG_CACHE", {})
+    monkeypatch.setattr(
+        ResourceConfig,
+        "_model_validate_cleanly",
+        MagicMock(side_effect=AssertionError("revalidated")),
+    )
+    second = load_resource_cfgs_from_yaml(config_dir, app_config, tmp_path)
+
+    assert second == first
+    assert second["courts"] is not first["courts"]
+
+    # a damaged cache file just means revalidating
+    monkeypatch.undo()
+    for cached in tmp_path.glob("*.resource.json"):
+        cached.write_bytes(cached.read_bytes()[:10])
+    monkeypatch.setattr(resource_loader, "_RESOURCE_CFG_CACHE", {})
+    assert load_resource_cfgs_from_yaml(config_dir, app_config, tmp_path) == first
+
+
+def test_resource_config_env_overrides_fill_missing_fields(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".env").write_text("DESCRIPTION=from dotenv\nemoji=D\n")
+    monkeypatch.setenv("EMOJI", "E")
+    monkeypatch.setenv("NAME", "Env name")
+    monkeypatch.setenv(
+        "CALENDARS", '{"court": {"id": "env@group.calendar.google.com"}}'
+    )
+    cfg = ResourceConfig._model_validate_cleanly(
+        {
+            "file_prefix": "courts",
+            "route_prefix": "/courts",
+            "name": "Courts",
+            "minutes_before_reminder": 60,
+            "maximum_days_ahead": 14,
+            "calendar_shown": True,
+            "contact_email": None,
+        }
+    )
+
+    # yaml values win, then environment variables, then .env
+    assert cfg.name == "Courts"
+    assert cfg.emoji == "E"
+    assert cfg.description == "from dotenv"
+    assert cfg.calendars["court"].id == "env@group.calendar.google.com"
+
+    # edits to .env and the environment are picked up by later loads
+    (tmp_path / ".env").write_text("DESCRIPTION=edited dotenv\n")
+    monkeypatch.setenv("EMOJI", "F")
+    assert env_overrides()["description"] == "edited dotenv"
+    assert env_overrides()["emoji"] == "F"
+
+
+def test_resource_config_from_json_bytes_round_trips():
+    app_config = AppConfig.from_yaml(EXAMPLE_ROOT / "app-config.yaml")
+    configs = load_resource_cfgs_from_yaml(
+        EXAMPLE_ROOT / "resource-configs", app_config
+    )
+
+    for cfg in configs.values():
+        assert ResourceConfig.from_json_bytes(cfg._json_bytes) == cfg
+
+
+def test_reservation_request_json_times_unchanged(reservation_request):
+    # only ResourceConfig dumps times in AM/PM format, requests keep iso times
+    dumped = reservation_request.model_dump(mode="json")
+    assert dumped["start_time"] == "10:00:00"
+    assert dumped["end_time"] == "11:00:00"
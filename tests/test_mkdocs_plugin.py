@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import shutil
+from datetime import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from mkdocs.exceptions import ConfigurationError
+
+import reserve_it
+from reserve_it.mkdocs_abuse import cache
+from reserve_it.mkdocs_abuse.cache import render_cached
+from reserve_it.mkdocs_abuse.plugin import (
+    ReserveItPlugin,
+    _build_time_slots,
+    _format_ampm,
+)
+from reserve_it.models.field_types import AM_PM_TIME_FORMAT
+
+EXAMPLE_ROOT = Path(reserve_it.__file__).parent / "example"
+
+
+def test_format_ampm_matches_strftime():
+    for hour in range(24):
+        for minute in range(60):
+            expected = time(hour, minute).strftime(AM_PM_TIME_FORMAT)
+            assert _format_ampm(hour, minute) == expected
+
+
+def test_build_time_slots_includes_day_end():
+    slots = _build_time_slots(time(8, 0), time(10, 0), 30)
+    assert slots == ("08:00 AM", "08:30 AM", "09:00 AM", "09:30 AM", "10:00 AM")
+
+    # day end that isn't on an increment boundary is excluded
+    assert _build_time_slots(time(0, 0), time(23, 59), 30)[-1] == "11:30 PM"
+
+
+@pytest.fixture
+def render_counter(monkeypatch):
+    """mock produce callback, with an empty in-memory page memo"""
+    monkeypatch.setattr(cache, "_MEMO", {})
+    return MagicMock(return_value="# page\n")
+
+
+def test_render_cached_miss_then_hit(tmp_path, render_counter):
+    assert render_cached(b"key", tmp_path, render_counter, slot="page") == "# page\n"
+    assert render_counter.call_count == 1
+
+    # a later process only has the disk entry
+    cache._MEMO.clear()
+    assert render_cached(b"key", tmp_path, render_counter, slot="page") == "# page\n"
+    assert render_counter.call_count == 1
+    # nothing but the entry itself is left in the cache dir (no temp files)
+    assert len(list(tmp_path.iterdir())) == 1
+
+
+def test_render_cached_new_key_rerenders(tmp_path, render_counter):
+    render_cached(b"key", tmp_path, render_counter, slot="page")
+    render_cached(b"other key", tmp_path, render_counter, slot="page")
+    assert render_counter.call_count == 2
+    # the changed page replaced the old one in memory
+    assert len(cache._MEMO) == 1
+
+
+def test_render_cached_rerenders_damaged_entry(tmp_path, render_counter):
+    render_cached(b"key", tmp_path, render_counter, slot="page")
+    (entry,) = tmp_path.iterdir()
+    # ie. an interrupted write from an older version
+    entry.write_bytes(entry.read_bytes()[:-3])
+
+    cache._MEMO.clear()
+    assert render_cached(b"key", tmp_path, render_counter, slot="page") == "# page\n"
+    assert render_counter.call_count == 2
+
+    # and the entry was repaired
+    cache._MEMO.clear()
+    render_cached(b"key", tmp_path, render_counter, slot="page")
+    assert render_counter.call_count == 2
+
+
+@pytest.fixture
+def site_project(tmp_path, monkeypatch):
+    """a copy of the example configs in tmp_path (also the cwd, for `.env`), and a
+    function running the plugin's on_config on them like a (re)build would"""
+    shutil.copy(EXAMPLE_ROOT / "app-config.yaml", tmp_path)
+    shutil.copytree(EXAMPLE_ROOT / "resource-configs", tmp_path / "resource-configs")
+    monkeypatch.chdir(tmp_path)
+    plugin = ReserveItPlugin()
+    errors, _ = plugin.load_config(
+        {
+            "app_config": str(tmp_path / "app-config.yaml"),
+            "resource_config_dir": str(tmp_path / "resource-configs"),
+            "cache_dir": str(tmp_path / "cache"),
+        }
+    )
+    assert not errors
+
+    def build():
+        plugin.on_config({"extra_javascript": [], "extra_css": []})
+        return plugin
+
+    return build
+
+
+def test_plugin_fails_on_missing_image(tmp_path, site_project):
+    site_project()
+
+    (tmp_path / "resource-configs" / "courts.jpg").unlink()
+    with pytest.raises(ConfigurationError, match="courts.jpg"):
+        site_project()
+
+
+def test_plugin_rebuild_picks_up_env_changes(tmp_path, monkeypatch, site_project):
+    courts_yaml = tmp_path / "resource-configs" / "2-courts.yaml"
+    courts_yaml.write_text(courts_yaml.read_text().replace("emoji: 🎾\n", ""))
+    (tmp_path / ".env").write_text("ALLOW_END_NEXT_DAY=true\n")
+    courts = site_project().resource_configs["courts"]
+    assert courts.allow_end_next_day
+    assert courts.emoji == ""
+
+    # neither change touches a yaml file, a serve rebuild still sees them
+    (tmp_path / ".env").write_text("ALLOW_END_NEXT_DAY=false\n")
+    monkeypatch.setenv("EMOJI", "Z")
+    courts = site_project().resource_configs["courts"]
+    assert not courts.allow_end_next_day
+    assert courts.emoji == "Z"
+
+
+def test_clear_cache_only_deletes_own_entries(tmp_path, render_counter):
+    render_cached(b"key", tmp_path, render_counter, slot="page")
+    (tmp_path / "0123456789abcdef.resource.json").write_text("{}")
+    # ie. another tool's files in a shared cache dir
+    (tmp_path / "notes.md").write_text("keep")
+    (tmp_path / "other").mkdir()
+
+    cache.clear_cache(tmp_path)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["notes.md", "other"]
+    assert not cache._MEMO
+
+
+def test_render_cached_unwritable_cache_dir(tmp_path, render_counter):
+    # a file where the cache dir should be, so the entry can't be written
+    cache_dir = tmp_path / "cache"
+    cache_dir.write_text("")
+
+    assert render_cached(b"key", cache_dir, render_counter, slot="page") == "# page\n"
+    cache._MEMO.clear()
+    render_cached(b"key", cache_dir, render_counter, slot="page")
+    assert render_counter.call_count == 2